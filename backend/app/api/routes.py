@@ -1,38 +1,76 @@
 """API route definitions."""
 
+import asyncio
+import logging
 import time
 from datetime import UTC, datetime
+from typing import Any
 
-from fastapi import APIRouter
+import msgspec
+import orjson
+from fastapi import APIRouter, Body, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from redis.exceptions import RedisError
 
 from app import __version__
 from app.api.schemas import (
     BatchRequest,
     BatchResponse,
-    BatchResultItem,
     BatchResultStatus,
     Classification,
     FeedbackRequest,
     FeedbackResponse,
+    FeedbackResponseStruct,
     HealthResponse,
+    HealthResponseStruct,
     ScoreResponse,
     StatsResponse,
+    StatsResponseStruct,
 )
+from app.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Track startup time for uptime calculation
-_startup_time = time.time()
+# Track startup time for uptime calculation (monotonic, immune to clock jumps)
+_startup_time = time.monotonic()
 
+# Batch bodies are validated through a prebuilt adapter rather than FastAPI's
+# per-request body model resolution
+_BATCH_REQUEST_ADAPTER = TypeAdapter(BatchRequest)
 
-@router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
-    """Health check endpoint."""
-    # TODO: Actually check Redis connection and model status
-    redis_connected = True  # Placeholder
+# Enum values resolved once instead of on every batch item
+_COMPLETED = BatchResultStatus.COMPLETED.value
+_CACHED = BatchResultStatus.CACHED.value
+_ERROR = BatchResultStatus.ERROR.value
+_UNKNOWN = Classification.UNKNOWN.value
+
+# Fixed, immutable part of a placeholder score; per-user fields (and the
+# mutable contributing_factors list) are filled in per request
+_SCORE_TEMPLATE: dict[str, Any] = {
+    "bot_probability": 0.0,
+    "confidence": 0.0,
+    "classification": _UNKNOWN,
+    "timezone_estimate": None,
+    "cached": False,
+    "cache_expires_at": None,
+}
+
+# Bounds concurrent Reddit fetches across all in-flight batch requests
+_REDDIT_SEMAPHORE = asyncio.Semaphore(10)
+
+# Shared encoder for the msgspec response structs
+_json_encoder = msgspec.json.Encoder()
+
+
+def _build_health_response(redis_connected: bool) -> HealthResponseStruct:
+    """Build the health response for the given Redis connection state."""
+    # TODO: Check model status once a trained model is loaded
     model_loaded = True  # Placeholder (using heuristic scorer)
 
-    return HealthResponse(
+    return HealthResponseStruct(
         status="healthy" if redis_connected else "degraded",
         redis_connected=redis_connected,
         model_loaded=model_loaded,
@@ -40,6 +78,77 @@ async def health_check() -> HealthResponse:
     )
 
 
+# Health only changes on Redis state transitions, so it is built and encoded
+# once and rebuilt by set_redis_connected() rather than on every probe.
+_health_response = _build_health_response(redis_connected=False)
+_health_body = _json_encoder.encode(_health_response)
+
+
+def set_redis_connected(connected: bool) -> None:
+    """Record a Redis connection state change for the health endpoint."""
+    global _health_response, _health_body
+
+    if connected != _health_response.redis_connected:
+        _health_response = _build_health_response(redis_connected=connected)
+        _health_body = _json_encoder.encode(_health_response)
+
+
+def _score_cache_key(username: str) -> str:
+    """Build the Redis key holding a user's cached score."""
+    return f"score:{username}"
+
+
+async def _get_cached_scores(usernames: list[str]) -> list[str | bytes | None]:
+    """Fetch cached scores for all usernames with a single MGET.
+
+    Outages and recoveries seen here update the health response, so each
+    transition is logged once rather than on every request.
+    """
+    try:
+        client = get_redis_client()
+        cached = await client.mget([_score_cache_key(u) for u in usernames])
+    except (RuntimeError, RedisError) as e:
+        if _health_response.redis_connected:
+            logger.warning("Score cache unavailable, analyzing all users: %s", e)
+            set_redis_connected(False)
+        return [None] * len(usernames)
+
+    if not _health_response.redis_connected:
+        logger.info("Score cache available again")
+        set_redis_connected(True)
+    return cached
+
+
+def _decode_cached_score(username: str, cached: str | bytes) -> dict[str, Any] | None:
+    """Decode a cached score, or return None if the entry is unusable."""
+    try:
+        score = orjson.loads(cached)
+    except orjson.JSONDecodeError:
+        score = None
+    if not isinstance(score, dict):
+        logger.warning("Ignoring malformed cached score for %s", username)
+        return None
+    return score
+
+
+async def _score_user(username: str, analyzed_at: str) -> dict[str, Any]:
+    """Analyze a single user that was not found in the cache."""
+    async with _REDDIT_SEMAPHORE:
+        # TODO: Fetch from Reddit and run actual analysis
+        return {
+            **_SCORE_TEMPLATE,
+            "username": username,
+            "contributing_factors": [],
+            "analyzed_at": analyzed_at,
+        }
+
+
+@router.get("/health", response_model=HealthResponse)
+async def health_check() -> Response:
+    """Health check endpoint."""
+    return Response(content=_health_body, media_type="application/json")
+
+
 @router.get("/score/{username}", response_model=ScoreResponse)
 async def get_score(username: str) -> ScoreResponse:
     """Get bot score for a single user."""
@@ -48,8 +157,8 @@ async def get_score(username: str) -> ScoreResponse:
     # 2. If not cached, fetch from Reddit and analyze
     # 3. Cache result and return
 
-    # Placeholder response
-    return ScoreResponse(
+    # Placeholder response (server-generated values, so skip validation)
+    return ScoreResponse.model_construct(
         username=username,
         bot_probability=0.0,
         confidence=0.0,
@@ -62,70 +171,125 @@ async def get_score(username: str) -> ScoreResponse:
     )
 
 
-@router.post("/analyze/batch", response_model=BatchResponse)
-async def analyze_batch(request: BatchRequest) -> BatchResponse:
+@router.post(
+    "/analyze/batch",
+    response_model=BatchResponse,
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": BatchRequest.model_json_schema()}
+            },
+            "required": True,
+        }
+    },
+)
+async def analyze_batch(raw: dict[str, Any] = Body(...)) -> Response:
     """Analyze multiple usernames in one request."""
-    start_time = time.time()
-
-    results: list[BatchResultItem] = []
-    for username in request.usernames:
-        try:
-            # TODO: Implement actual batch analysis
-            score = ScoreResponse(
-                username=username,
-                bot_probability=0.0,
-                confidence=0.0,
-                classification=Classification.UNKNOWN,
-                contributing_factors=[],
-                timezone_estimate=None,
-                analyzed_at=datetime.now(UTC),
-                cached=False,
-                cache_expires_at=None,
+    start_ns = time.perf_counter_ns()
+    try:
+        request = _BATCH_REQUEST_ADAPTER.validate_python(raw, strict=True)
+    except ValidationError as e:
+        errors = [{**err, "loc": ("body", *err["loc"])} for err in e.errors()]
+        raise RequestValidationError(errors) from e
+
+    # All items in a batch share one logical analysis timestamp
+    analyzed_at = datetime.now(UTC).isoformat()
+
+    # Serve what we can from the cache in one round-trip, then score the
+    # misses concurrently rather than one username at a time.
+    # Malformed cache entries are treated as misses and re-analyzed.
+    if request.force_refresh:
+        cached_scores: list[dict[str, Any] | None] = [None] * len(request.usernames)
+    else:
+        cached_scores = [
+            None if cached is None else _decode_cached_score(username, cached)
+            for username, cached in zip(
+                request.usernames,
+                await _get_cached_scores(request.usernames),
+                strict=True,
             )
+        ]
+    misses = [
+        username
+        for username, cached in zip(request.usernames, cached_scores, strict=True)
+        if cached is None
+    ]
+    scored = await asyncio.gather(
+        *(_score_user(username, analyzed_at) for username in misses),
+        return_exceptions=True,
+    )
+    scores_by_user = dict(zip(misses, scored, strict=True))
+
+    # Results share a fixed shape, so they are emitted as plain dicts and
+    # serialized by orjson rather than built as response models.
+    results: list[dict[str, Any]] = []
+    for username, cached in zip(request.usernames, cached_scores, strict=True):
+        if cached is not None:
             results.append(
-                BatchResultItem(
-                    username=username,
-                    status=BatchResultStatus.COMPLETED,
-                    score=score,
-                )
+                {
+                    "username": username,
+                    "status": _CACHED,
+                    "score": {**cached, "cached": True},
+                    "error": None,
+                }
             )
-        except Exception as e:
+            continue
+
+        score = scores_by_user[username]
+        if isinstance(score, BaseException):
             results.append(
-                BatchResultItem(
-                    username=username,
-                    status=BatchResultStatus.ERROR,
-                    error=str(e),
-                )
+                {
+                    "username": username,
+                    "status": _ERROR,
+                    "score": None,
+                    "error": str(score),
+                }
+            )
+        else:
+            results.append(
+                {
+                    "username": username,
+                    "status": _COMPLETED,
+                    "score": score,
+                    "error": None,
+                }
             )
 
-    processing_time_ms = int((time.time() - start_time) * 1000)
+    processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
-    return BatchResponse(
-        results=results,
-        processing_time_ms=processing_time_ms,
+    return Response(
+        content=orjson.dumps(
+            {"results": results, "processing_time_ms": processing_time_ms}
+        ),
+        media_type="application/json",
     )
 
 
 @router.post("/feedback", response_model=FeedbackResponse)
-async def submit_feedback(request: FeedbackRequest) -> FeedbackResponse:
+async def submit_feedback(request: FeedbackRequest) -> Response:
     """Submit feedback on a score."""
     # TODO: Store feedback for model retraining
-    return FeedbackResponse(
+    response = FeedbackResponseStruct(
         success=True,
         message=f"Feedback recorded for {request.username}",
     )
+    return Response(
+        content=_json_encoder.encode(response), media_type="application/json"
+    )
 
 
 @router.get("/stats", response_model=StatsResponse)
-async def get_stats() -> StatsResponse:
+async def get_stats() -> Response:
     """Get system statistics."""
-    uptime_seconds = int(time.time() - _startup_time)
+    uptime_seconds = int(time.monotonic() - _startup_time)
 
     # TODO: Get actual stats from Redis
-    return StatsResponse(
+    response = StatsResponseStruct(
         total_accounts_analyzed=0,
         cache_hit_rate=0.0,
         model_version=__version__,
         uptime_seconds=uptime_seconds,
-        feedback_counts={},
+    )
+    return Response(
+        content=_json_encoder.encode(response), media_type="application/json"
     )
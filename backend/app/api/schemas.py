@@ -3,7 +3,9 @@
 from datetime import datetime
 from enum import Enum
 
+import msgspec
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 
 
 class Classification(str, Enum):
@@ -15,7 +17,10 @@ class Classification(str, Enum):
     UNKNOWN = "unknown"
 
 
-class ContributingFactor(BaseModel):
+# A slotted dataclass rather than a BaseModel: a batch response can carry many
+# factors, and slots avoid a per-instance __dict__ and fields-set tracking.
+@dataclass(frozen=True, slots=True)
+class ContributingFactor:
     """A factor contributing to the bot score."""
 
     factor: str = Field(..., description="Name of the feature")
@@ -119,3 +124,34 @@ class StatsResponse(BaseModel):
     model_version: str
     uptime_seconds: int
     feedback_counts: dict[str, int] = Field(default_factory=dict)
+
+
+# msgspec mirrors of the flat response models above, used by endpoints that
+# only ever return server-generated data. The Pydantic models stay as the
+# documented response_model for each route.
+
+
+class HealthResponseStruct(msgspec.Struct, frozen=True):
+    """Encoding struct for HealthResponse."""
+
+    status: str
+    redis_connected: bool
+    model_loaded: bool
+    version: str
+
+
+class FeedbackResponseStruct(msgspec.Struct, frozen=True):
+    """Encoding struct for FeedbackResponse."""
+
+    success: bool
+    message: str
+
+
+class StatsResponseStruct(msgspec.Struct, frozen=True):
+    """Encoding struct for StatsResponse."""
+
+    total_accounts_analyzed: int
+    cache_hit_rate: float
+    model_version: str
+    uptime_seconds: int
+    feedback_counts: dict[str, int] = msgspec.field(default_factory=dict)
@@ -1,17 +1,14 @@
-"""Application configuration using Pydantic settings."""
+"""Application configuration loaded from environment variables."""
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import os
+from dataclasses import dataclass
+from functools import lru_cache
 
 
-class Settings(BaseSettings):
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings loaded from environment variables."""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-    )
-
     # Reddit API
     reddit_client_id: str = ""
     reddit_client_secret: str = ""
@@ -31,4 +28,24 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Read settings from the environment, once per process."""
+    defaults = Settings()
+    return Settings(
+        reddit_client_id=os.getenv("REDDIT_CLIENT_ID", defaults.reddit_client_id),
+        reddit_client_secret=os.getenv(
+            "REDDIT_CLIENT_SECRET", defaults.reddit_client_secret
+        ),
+        reddit_user_agent=os.getenv("REDDIT_USER_AGENT", defaults.reddit_user_agent),
+        redis_url=os.getenv("REDIS_URL", defaults.redis_url),
+        api_host=os.getenv("API_HOST", defaults.api_host),
+        api_port=int(os.getenv("API_PORT", defaults.api_port)),
+        score_cache_ttl_hours=int(
+            os.getenv("SCORE_CACHE_TTL_HOURS", defaults.score_cache_ttl_hours)
+        ),
+        log_level=os.getenv("LOG_LEVEL", defaults.log_level),
+    )
+
+
+settings = get_settings()
@@ -4,12 +4,14 @@ import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-import redis
-from fastapi import FastAPI
+import orjson
+import redis.asyncio as redis
+from fastapi import FastAPI, Response
 
 from app import __version__
-from app.api.routes import router
+from app.api.routes import router, set_redis_connected
 from app.config import settings
+from app.redis_client import set_redis_client
 
 # Configure logging
 logging.basicConfig(
@@ -18,41 +20,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Redis client (initialized on startup)
-_redis_client: redis.Redis | None = None
-
-
-def get_redis_client() -> redis.Redis:
-    """Get the Redis client instance."""
-    if _redis_client is None:
-        raise RuntimeError("Redis client not initialized")
-    return _redis_client
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler for startup/shutdown."""
-    global _redis_client
-
     # Startup
     logger.info("Starting RedditSentinel API v%s", __version__)
+    client: redis.Redis | None
     try:
-        _redis_client = redis.from_url(
+        client = redis.from_url(
             settings.redis_url,
             decode_responses=True,
+            max_connections=32,
+            socket_keepalive=True,
+            # Fail fast so an unresponsive node degrades to cache misses
+            # instead of hanging requests (or startup) indefinitely
+            socket_connect_timeout=2,
+            socket_timeout=1,
         )
-        _redis_client.ping()
+        await client.ping()
         logger.info("Connected to Redis at %s", settings.redis_url)
-    except redis.ConnectionError as e:
+    except (redis.ConnectionError, redis.TimeoutError) as e:
         logger.warning("Failed to connect to Redis: %s", e)
-        _redis_client = None
+        client = None
+    set_redis_client(client)
+    set_redis_connected(client is not None)
 
     yield
 
     # Shutdown
-    if _redis_client:
-        _redis_client.close()
+    set_redis_client(None)
+    if client:
+        await client.aclose()
         logger.info("Closed Redis connection")
+    set_redis_connected(False)
 
 
 app = FastAPI(
@@ -65,7 +66,20 @@ app = FastAPI(
 app.include_router(router, prefix="/v1")
 
 
+# The root payload never changes, so it is encoded once at import
+_ROOT_BODY = orjson.dumps({"message": "RedditSentinel API", "version": __version__})
+
+# Liveness only: answers "is the process up" without touching Redis
+_HEALTHZ_BODY = b'{"ok":true}'
+
+
 @app.get("/")
-async def root() -> dict[str, str]:
+async def root() -> Response:
     """Root endpoint."""
-    return {"message": "RedditSentinel API", "version": __version__}
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
+@app.get("/healthz", include_in_schema=False)
+async def healthz() -> Response:
+    """Liveness probe for the load balancer; see /v1/health for details."""
+    return Response(content=_HEALTHZ_BODY, media_type="application/json")
@@ -0,0 +1,19 @@
+"""Shared async Redis client, installed by the application lifespan."""
+
+import redis.asyncio as redis
+
+# Async Redis client backed by a connection pool (set on startup)
+_redis_client: redis.Redis | None = None
+
+
+def get_redis_client() -> redis.Redis:
+    """Get the Redis client instance."""
+    if _redis_client is None:
+        raise RuntimeError("Redis client not initialized")
+    return _redis_client
+
+
+def set_redis_client(client: redis.Redis | None) -> None:
+    """Install the shared Redis client, or clear it with None."""
+    global _redis_client
+    _redis_client = client
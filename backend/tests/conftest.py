@@ -1,5 +1,6 @@
 """Pytest fixtures for RedditSentinel tests."""
 
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
@@ -8,10 +9,97 @@ import pytest
 from fastapi.testclient import TestClient
 
 
-@pytest.fixture
-def redis_client():
+@dataclass(frozen=True, slots=True)
+class FakeSubreddit:
+    """Stand-in for a PRAW Subreddit with the attributes we read."""
+
+    display_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class FakeSubmission:
+    """Stand-in for a PRAW Submission with the attributes we read."""
+
+    title: str
+    selftext: str
+    subreddit: FakeSubreddit
+    created_utc: float
+    score: int
+
+
+@dataclass(frozen=True, slots=True)
+class FakeComment:
+    """Stand-in for a PRAW Comment with the attributes we read."""
+
+    body: str
+    subreddit: FakeSubreddit
+    created_utc: float
+    score: int
+
+
+# Immutable sample data, built once at import and shared by all tests
+_SAMPLE_SUBMISSIONS = tuple(
+    FakeSubmission(
+        title=f"Test Post {i}",
+        selftext=f"This is the content of test post {i}.",
+        subreddit=FakeSubreddit(name),
+        created_utc=datetime(2024, 1, i + 1, 12, 0, tzinfo=UTC).timestamp(),
+        score=100 + i * 10,
+    )
+    for i, name in enumerate(["funny", "pics", "news", "funny", "pics"])
+)
+
+_SAMPLE_COMMENTS = tuple(
+    FakeComment(
+        body=f"This is test comment number {i}. It has some words in it.",
+        subreddit=FakeSubreddit(["funny", "pics", "news"][i % 3]),
+        created_utc=datetime(2024, 1, 1, i, 0, tzinfo=UTC).timestamp(),
+        score=10 + i,
+    )
+    for i in range(10)
+)
+
+_BOT_LIKE_COMMENTS = tuple(
+    FakeComment(
+        body=text,
+        subreddit=FakeSubreddit("spam"),  # Low diversity
+        created_utc=datetime(2024, 1, 1, 3, i, tzinfo=UTC).timestamp(),  # Same hour
+        score=1,
+    )
+    for i, text in enumerate(
+        [
+            "Kindly check this out, it peaked my interest!",
+            "I'm loosing my mind over this leek in the system.",
+            "Please do the needful and revert back to me.",
+            "This is so helpful! Same to you my friend.",
+            "I will prepone the meeting and discuss about it.",
+        ]
+    )
+)
+
+
+@pytest.fixture(scope="session")
+def redis_server():
+    """Provide a fake Redis server shared by the sync and async clients."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture(scope="session")
+def redis_client(redis_server):
     """Provide a fake Redis client for testing."""
-    return fakeredis.FakeRedis(decode_responses=True)
+    return fakeredis.FakeRedis(server=redis_server, decode_responses=True)
+
+
+@pytest.fixture(autouse=True)
+def clean_redis(redis_client):
+    """Start every test with an empty fake Redis."""
+    redis_client.flushall()
+
+
+@pytest.fixture
+def async_redis_client(redis_server):
+    """Provide a fake async Redis client, as used by the app, for testing."""
+    return fakeredis.FakeAsyncRedis(server=redis_server, decode_responses=True)
 
 
 @pytest.fixture
@@ -37,33 +125,16 @@ def sample_redditor():
     return redditor
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_submissions():
     """Provide sample submission objects for testing."""
-    submissions = []
-    for i in range(5):
-        sub = MagicMock()
-        sub.title = f"Test Post {i}"
-        sub.selftext = f"This is the content of test post {i}."
-        sub.subreddit.display_name = ["funny", "pics", "news", "funny", "pics"][i]
-        sub.created_utc = datetime(2024, 1, i + 1, 12, 0, tzinfo=UTC).timestamp()
-        sub.score = 100 + i * 10
-        submissions.append(sub)
-    return submissions
+    return _SAMPLE_SUBMISSIONS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_comments():
     """Provide sample comment objects for testing."""
-    comments = []
-    for i in range(10):
-        comment = MagicMock()
-        comment.body = f"This is test comment number {i}. It has some words in it."
-        comment.subreddit.display_name = ["funny", "pics", "news"][i % 3]
-        comment.created_utc = datetime(2024, 1, 1, i, 0, tzinfo=UTC).timestamp()
-        comment.score = 10 + i
-        comments.append(comment)
-    return comments
+    return _SAMPLE_COMMENTS
 
 
 @pytest.fixture
@@ -80,34 +151,17 @@ def bot_like_redditor():
     return redditor
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bot_like_comments():
     """Provide comments with bot-like linguistic patterns."""
-    comments = []
-    texts = [
-        "Kindly check this out, it peaked my interest!",
-        "I'm loosing my mind over this leek in the system.",
-        "Please do the needful and revert back to me.",
-        "This is so helpful! Same to you my friend.",
-        "I will prepone the meeting and discuss about it.",
-    ]
-    for i, text in enumerate(texts):
-        comment = MagicMock()
-        comment.body = text
-        comment.subreddit.display_name = "spam"  # Low diversity
-        comment.created_utc = datetime(
-            2024, 1, 1, 3, i, tzinfo=UTC
-        ).timestamp()  # Same hour
-        comment.score = 1
-        comments.append(comment)
-    return comments
+    return _BOT_LIKE_COMMENTS
 
 
 @pytest.fixture
-def app_client(redis_client, mock_reddit):
+def app_client(async_redis_client, mock_reddit):
     """Provide a test client for the FastAPI app."""
     # Import here to avoid circular imports and allow mocking
-    with patch("app.main.get_redis_client", return_value=redis_client):
+    with patch("app.api.routes.get_redis_client", return_value=async_redis_client):
         from app.main import app
 
         with TestClient(app) as client:
@@ -0,0 +1,252 @@
+"""Tests for the API endpoints."""
+
+import json
+from unittest.mock import patch
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.api.routes import _score_user, set_redis_connected
+
+CACHED_SCORE = {
+    "username": "alice",
+    "bot_probability": 0.9,
+    "confidence": 0.8,
+    "classification": "likely_bot",
+    "contributing_factors": [],
+    "timezone_estimate": None,
+    "analyzed_at": "2024-01-01T00:00:00+00:00",
+    "cached": False,
+    "cache_expires_at": None,
+}
+
+
+class TestScoreEndpoint:
+    """Tests for GET /v1/score/{username}."""
+
+    def test_returns_placeholder_score(self, app_client):
+        """Verify an unscored user gets an unknown classification."""
+        response = app_client.get("/v1/score/TestUser123")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["username"] == "TestUser123"
+        assert data["bot_probability"] == 0.0
+        assert data["classification"] == "unknown"
+        assert data["contributing_factors"] == []
+        assert data["cached"] is False
+
+
+class TestBatchEndpoint:
+    """Tests for POST /v1/analyze/batch."""
+
+    def test_returns_result_per_username(self, app_client):
+        """Verify every requested username gets a completed result."""
+        usernames = ["alice", "bob", "carol"]
+        response = app_client.post("/v1/analyze/batch", json={"usernames": usernames})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["username"] for r in data["results"]] == usernames
+        assert all(r["status"] == "completed" for r in data["results"])
+        assert all(r["score"]["username"] == r["username"] for r in data["results"])
+        assert data["processing_time_ms"] >= 0
+
+    def test_batch_shares_analysis_timestamp(self, app_client):
+        """Verify all items in one batch share the same timestamp."""
+        response = app_client.post(
+            "/v1/analyze/batch", json={"usernames": ["alice", "bob"]}
+        )
+
+        timestamps = {r["score"]["analyzed_at"] for r in response.json()["results"]}
+        assert len(timestamps) == 1
+
+    def test_rejects_empty_batch(self, app_client):
+        """Verify an empty username list is rejected."""
+        response = app_client.post("/v1/analyze/batch", json={"usernames": []})
+
+        assert response.status_code == 422
+
+    def test_rejects_oversized_batch(self, app_client):
+        """Verify batches above the 50 username limit are rejected."""
+        usernames = [f"user{i}" for i in range(51)]
+        response = app_client.post("/v1/analyze/batch", json={"usernames": usernames})
+
+        assert response.status_code == 422
+
+    def test_serves_cached_scores(self, app_client, redis_client):
+        """Verify cached users are returned from Redis and others analyzed."""
+        redis_client.set("score:alice", json.dumps(CACHED_SCORE))
+
+        response = app_client.post(
+            "/v1/analyze/batch", json={"usernames": ["alice", "bob"]}
+        )
+
+        alice, bob = response.json()["results"]
+        assert alice["status"] == "cached"
+        assert alice["score"]["bot_probability"] == 0.9
+        assert alice["score"]["cached"] is True
+        assert bob["status"] == "completed"
+        assert bob["score"]["classification"] == "unknown"
+
+    def test_malformed_cache_entries_are_reanalyzed(self, app_client, redis_client):
+        """Verify unusable cache entries are treated as misses, not errors."""
+        redis_client.set("score:alice", "not json")
+        redis_client.set("score:bob", "[1, 2]")
+        redis_client.set("score:carol", json.dumps(CACHED_SCORE))
+
+        response = app_client.post(
+            "/v1/analyze/batch", json={"usernames": ["alice", "bob", "carol"]}
+        )
+
+        assert response.status_code == 200
+        alice, bob, carol = response.json()["results"]
+        assert alice["status"] == "completed"
+        assert bob["status"] == "completed"
+        assert carol["status"] == "cached"
+
+    def test_force_refresh_skips_cache(self, app_client, redis_client):
+        """Verify force_refresh re-analyzes users even when cached."""
+        redis_client.set("score:alice", json.dumps(CACHED_SCORE))
+
+        response = app_client.post(
+            "/v1/analyze/batch",
+            json={"usernames": ["alice"], "force_refresh": True},
+        )
+
+        (alice,) = response.json()["results"]
+        assert alice["status"] == "completed"
+        assert alice["score"]["cached"] is False
+
+    def test_reports_per_user_errors(self, app_client):
+        """Verify one failing user does not fail the whole batch."""
+
+        async def score_user(username, analyzed_at):
+            if username == "broken":
+                raise ValueError("user suspended")
+            return {"username": username, "analyzed_at": analyzed_at}
+
+        with patch("app.api.routes._score_user", side_effect=score_user):
+            response = app_client.post(
+                "/v1/analyze/batch", json={"usernames": ["alice", "broken"]}
+            )
+
+        alice, broken = response.json()["results"]
+        assert alice["status"] == "completed"
+        assert broken["status"] == "error"
+        assert broken["score"] is None
+        assert broken["error"] == "user suspended"
+
+    async def test_scores_do_not_share_mutable_state(self):
+        """Verify mutating one score does not leak into later scores."""
+        first = await _score_user("alice", "2024-01-01T00:00:00+00:00")
+        first["contributing_factors"].append({"factor": "leak"})
+
+        second = await _score_user("bob", "2024-01-01T00:00:00+00:00")
+
+        assert second["contributing_factors"] == []
+
+    def test_rejects_non_string_usernames(self, app_client):
+        """Verify usernames are validated strictly rather than coerced."""
+        response = app_client.post("/v1/analyze/batch", json={"usernames": [123]})
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "usernames", 0]
+
+
+class TestHealthEndpoint:
+    """Tests for GET /v1/health."""
+
+    def test_reports_redis_state(self, app_client):
+        """Verify the cached health response follows Redis state changes."""
+        set_redis_connected(True)
+        healthy = app_client.get("/v1/health").json()
+        set_redis_connected(False)
+        degraded = app_client.get("/v1/health").json()
+
+        assert healthy["status"] == "healthy"
+        assert healthy["redis_connected"] is True
+        assert degraded["status"] == "degraded"
+        assert degraded["redis_connected"] is False
+
+    def test_follows_cache_outages(self, app_client):
+        """Verify a Redis failure on the batch path is reflected in health."""
+        set_redis_connected(True)
+        with patch(
+            "app.api.routes.get_redis_client",
+            side_effect=RedisConnectionError("connection refused"),
+        ):
+            app_client.post("/v1/analyze/batch", json={"usernames": ["alice"]})
+        degraded = app_client.get("/v1/health").json()
+        app_client.post("/v1/analyze/batch", json={"usernames": ["alice"]})
+        recovered = app_client.get("/v1/health").json()
+
+        assert degraded["redis_connected"] is False
+        assert recovered["redis_connected"] is True
+
+
+class TestStatsEndpoint:
+    """Tests for GET /v1/stats."""
+
+    def test_returns_stats(self, app_client):
+        """Verify stats include every field of the response schema."""
+        response = app_client.get("/v1/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {
+            "total_accounts_analyzed",
+            "cache_hit_rate",
+            "model_version",
+            "uptime_seconds",
+            "feedback_counts",
+        }
+        assert data["uptime_seconds"] >= 0
+
+
+class TestFeedbackEndpoint:
+    """Tests for POST /v1/feedback."""
+
+    def test_records_feedback(self, app_client):
+        """Verify feedback is acknowledged for the given user."""
+        response = app_client.post(
+            "/v1/feedback",
+            json={"username": "TestUser123", "feedback_type": "false_positive"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "success": True,
+            "message": "Feedback recorded for TestUser123",
+        }
+
+    def test_rejects_unknown_feedback_type(self, app_client):
+        """Verify feedback types outside the enum are rejected."""
+        response = app_client.post(
+            "/v1/feedback",
+            json={"username": "TestUser123", "feedback_type": "spam"},
+        )
+
+        assert response.status_code == 422
+
+
+class TestRootEndpoint:
+    """Tests for GET /."""
+
+    def test_returns_service_info(self, app_client):
+        """Verify the root endpoint identifies the service."""
+        response = app_client.get("/")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["message"] == "RedditSentinel API"
+
+
+class TestLivenessEndpoint:
+    """Tests for GET /healthz."""
+
+    def test_returns_ok(self, app_client):
+        """Verify the liveness probe answers without Redis."""
+        response = app_client.get("/healthz")
+
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
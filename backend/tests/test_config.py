@@ -0,0 +1,45 @@
+"""Tests for application configuration."""
+
+import pytest
+
+from app.config import get_settings
+
+
+@pytest.fixture(autouse=True)
+def clear_settings_cache():
+    """Re-read the environment for every test."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+class TestSettings:
+    """Tests for loading settings from the environment."""
+
+    def test_defaults_without_environment(self, monkeypatch):
+        """Verify unset variables fall back to the dataclass defaults."""
+        for name in ("REDIS_URL", "API_PORT", "SCORE_CACHE_TTL_HOURS", "LOG_LEVEL"):
+            monkeypatch.delenv(name, raising=False)
+
+        settings = get_settings()
+
+        assert settings.redis_url == "redis://localhost:6379/0"
+        assert settings.api_port == 8000
+        assert settings.score_cache_ttl_hours == 48
+        assert settings.log_level == "INFO"
+
+    def test_reads_environment(self, monkeypatch):
+        """Verify variables are read and integer fields are parsed."""
+        monkeypatch.setenv("REDIS_URL", "redis://cache:6379/1")
+        monkeypatch.setenv("API_PORT", "9000")
+        monkeypatch.setenv("SCORE_CACHE_TTL_HOURS", "12")
+
+        settings = get_settings()
+
+        assert settings.redis_url == "redis://cache:6379/1"
+        assert settings.api_port == 9000
+        assert settings.score_cache_ttl_hours == 12
+
+    def test_settings_are_cached(self):
+        """Verify the environment is only read once per process."""
+        assert get_settings() is get_settings()
@@ -0,0 +1,49 @@
+"""Tests for API schemas."""
+
+from datetime import UTC, datetime
+
+from app.api.schemas import Classification, ContributingFactor, ScoreResponse
+
+
+class TestContributingFactor:
+    """Tests for the ContributingFactor schema."""
+
+    def test_validates_from_dict(self):
+        """Verify factors given as dicts are validated into dataclasses."""
+        score = ScoreResponse(
+            username="TestUser123",
+            bot_probability=0.7,
+            confidence=0.5,
+            classification=Classification.SUSPICIOUS,
+            contributing_factors=[
+                {"factor": "account_age_days", "contribution": 0.3, "value": 15}
+            ],
+            analyzed_at=datetime(2024, 1, 1, tzinfo=UTC),
+        )
+
+        (factor,) = score.contributing_factors
+        assert isinstance(factor, ContributingFactor)
+        assert factor.value == 15
+
+    def test_serializes_as_object(self):
+        """Verify factors keep the same JSON shape as before."""
+        score = ScoreResponse(
+            username="TestUser123",
+            bot_probability=0.7,
+            confidence=0.5,
+            classification=Classification.SUSPICIOUS,
+            contributing_factors=[
+                ContributingFactor(factor="burst_score", contribution=0.2, value=0.9)
+            ],
+            analyzed_at=datetime(2024, 1, 1, tzinfo=UTC),
+        )
+
+        assert score.model_dump(mode="json")["contributing_factors"] == [
+            {"factor": "burst_score", "contribution": 0.2, "value": 0.9}
+        ]
+
+    def test_has_no_instance_dict(self):
+        """Verify factors are slotted."""
+        factor = ContributingFactor(factor="trophy_count", contribution=0.1, value=0)
+
+        assert not hasattr(factor, "__dict__")
@@ -136,6 +136,9 @@ class ApplicationStack(Stack):
             removal_policy=RemovalPolicy.DESTROY,
         )
 
+        # Image tag to run; the pipeline pins this to the commit it tested
+        image_tag = self.node.try_get_context("image_tag") or "latest"
+
         # ECS Fargate Service with ALB
         fargate_service = ecs_patterns.ApplicationLoadBalancedFargateService(
             self,
@@ -145,8 +148,13 @@ class ApplicationStack(Stack):
             cpu=256,
             memory_limit_mib=512,
             desired_count=1,
+            # Graviton: cheaper per vCPU-hour; image is built on an ARM host
+            runtime_platform=ecs.RuntimePlatform(
+                cpu_architecture=ecs.CpuArchitecture.ARM64,
+                operating_system_family=ecs.OperatingSystemFamily.LINUX,
+            ),
             task_image_options=ecs_patterns.ApplicationLoadBalancedTaskImageOptions(
-                image=ecs.ContainerImage.from_ecr_repository(ecr_repo, tag="latest"),
+                image=ecs.ContainerImage.from_ecr_repository(ecr_repo, tag=image_tag),
                 container_port=8000,
                 log_driver=ecs.LogDrivers.aws_logs(
                     stream_prefix="api",
@@ -177,9 +185,9 @@ class ApplicationStack(Stack):
             security_groups=[ecs_sg],
         )
 
-        # Health check
+        # Health check (liveness only; /v1/health stays the detailed endpoint)
         fargate_service.target_group.configure_health_check(
-            path="/v1/health",
+            path="/healthz",
             healthy_http_codes="200",
             interval=Duration.seconds(30),
             timeout=Duration.seconds(5),
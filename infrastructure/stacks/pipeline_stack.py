@@ -1,6 +1,7 @@
 """CI/CD Pipeline stack using AWS CodePipeline and CodeBuild."""
 
 from aws_cdk import (
+    Duration,
     RemovalPolicy,
     Stack,
 )
@@ -42,20 +43,56 @@ class PipelineStack(Stack):
             removal_policy=RemovalPolicy.RETAIN,
             lifecycle_rules=[
                 ecr.LifecycleRule(
+                    rule_priority=1,
+                    tag_status=ecr.TagStatus.UNTAGGED,
+                    max_image_age=Duration.days(1),
+                    description="Expire untagged images after a day",
+                ),
+                # Matched ahead of the ANY rule so the BuildKit cache manifest
+                # never takes one of the image slots below
+                ecr.LifecycleRule(
+                    rule_priority=2,
+                    tag_status=ecr.TagStatus.TAGGED,
+                    tag_prefix_list=["buildcache"],
+                    max_image_count=1,
+                    description="Keep only the current build cache",
+                ),
+                # Build pushes before Test finishes, so leave enough headroom
+                # that untested pushes can't expire the image in service
+                ecr.LifecycleRule(
+                    rule_priority=3,
+                    tag_status=ecr.TagStatus.ANY,
                     max_image_count=10,
-                    description="Keep only 10 images",
-                )
+                    description="Keep only the 10 most recent images",
+                ),
             ],
         )
 
+        # Pull-through cache so base images are served from this account's ECR
+        # rather than fetched from public.ecr.aws on every build
+        ecr.CfnPullThroughCacheRule(
+            self,
+            "EcrPublicCache",
+            ecr_repository_prefix="ecr-public",
+            upstream_registry_url="public.ecr.aws",
+        )
+
         # S3 bucket for pipeline artifacts
         artifact_bucket = s3.Bucket(
             self,
             "ArtifactBucket",
             bucket_name=f"reddit-sentinel-artifacts-{self.account}",
             removal_policy=RemovalPolicy.DESTROY,
-            auto_delete_objects=True,
             encryption=s3.BucketEncryption.S3_MANAGED,
+            # Expire old artifacts instead of an auto-delete custom resource
+            lifecycle_rules=[
+                s3.LifecycleRule(
+                    expiration=Duration.days(14),
+                    abort_incomplete_multipart_upload_after=Duration.days(1),
+                )
+            ],
+            # Lets out-of-region clients reach the bucket via the nearest edge
+            transfer_acceleration=True,
         )
 
         # CodeStar connection to GitHub (must be manually activated in console)
@@ -78,6 +115,9 @@ class PipelineStack(Stack):
             connection_arn=github_connection.attr_connection_arn,
             output=source_output,
             trigger_on_push=True,
+            # CodeBuild clones the repo itself instead of unzipping an S3 copy;
+            # the CodeBuild actions grant each project UseConnection for this
+            code_build_clone_output=True,
         )
 
         # CodeBuild project for testing
@@ -87,11 +127,26 @@ class PipelineStack(Stack):
             project_name="reddit-sentinel-test",
             description="Run tests and linting for RedditSentinel",
             environment=codebuild.BuildEnvironment(
-                build_image=codebuild.LinuxBuildImage.STANDARD_7_0,
+                build_image=codebuild.LinuxArmBuildImage.AMAZON_LINUX_2_STANDARD_3_0,
                 compute_type=codebuild.ComputeType.SMALL,
             ),
             build_spec=codebuild.BuildSpec.from_source_filename("buildspec-test.yml"),
-            cache=codebuild.Cache.local(codebuild.LocalCacheMode.DOCKER_LAYER),
+            # S3-backed so the pip and npm caches survive across build hosts
+            cache=codebuild.Cache.bucket(artifact_bucket, prefix="cache/test"),
+        )
+
+        # The test project runs cdk synth, so it needs the bootstrap lookup
+        # role for context lookups missing from cdk.context.json
+        test_project.add_to_role_policy(
+            iam.PolicyStatement(
+                actions=["sts:AssumeRole"],
+                resources=[
+                    (
+                        f"arn:aws:iam::{self.account}:role/"
+                        f"cdk-hnb659fds-lookup-role-{self.account}-{self.region}"
+                    )
+                ],
+            )
         )
 
         # CodeBuild project for building Docker image
@@ -101,8 +156,10 @@ class PipelineStack(Stack):
             project_name="reddit-sentinel-build",
             description="Build and push Docker image for RedditSentinel",
             environment=codebuild.BuildEnvironment(
-                build_image=codebuild.LinuxBuildImage.STANDARD_7_0,
-                compute_type=codebuild.ComputeType.SMALL,
+                # ARM host so the image matches the ARM64 Fargate task natively
+                build_image=codebuild.LinuxArmBuildImage.AMAZON_LINUX_2_STANDARD_3_0,
+                # Docker builds are CPU/IO bound; SMALL starves BuildKit
+                compute_type=codebuild.ComputeType.MEDIUM,
                 privileged=True,  # Required for Docker builds
             ),
             environment_variables={
@@ -114,11 +171,24 @@ class PipelineStack(Stack):
                 ),
             },
             build_spec=codebuild.BuildSpec.from_source_filename("buildspec-build.yml"),
-            cache=codebuild.Cache.local(codebuild.LocalCacheMode.DOCKER_LAYER),
         )
 
         # Grant ECR permissions to build project
         self.ecr_repo.grant_pull_push(build_project)
+        build_project.add_to_role_policy(
+            iam.PolicyStatement(
+                actions=[
+                    "ecr:BatchCheckLayerAvailability",
+                    "ecr:BatchGetImage",
+                    "ecr:BatchImportUpstreamImage",
+                    "ecr:CreateRepository",
+                    "ecr:GetDownloadUrlForLayer",
+                ],
+                resources=[
+                    f"arn:aws:ecr:{self.region}:{self.account}:repository/ecr-public/*"
+                ],
+            )
+        )
 
         # CodeBuild project for CDK deploy
         deploy_project = codebuild.PipelineProject(
@@ -127,7 +197,7 @@ class PipelineStack(Stack):
             project_name="reddit-sentinel-deploy",
             description="Deploy RedditSentinel infrastructure via CDK",
             environment=codebuild.BuildEnvironment(
-                build_image=codebuild.LinuxBuildImage.STANDARD_7_0,
+                build_image=codebuild.LinuxArmBuildImage.AMAZON_LINUX_2_STANDARD_3_0,
                 compute_type=codebuild.ComputeType.SMALL,
             ),
             environment_variables={
@@ -136,49 +206,82 @@ class PipelineStack(Stack):
                 ),
             },
             build_spec=codebuild.BuildSpec.from_source_filename("buildspec-deploy.yml"),
+            # S3-backed so the npm cache survives across build hosts
+            cache=codebuild.Cache.bucket(artifact_bucket, prefix="cache/deploy"),
         )
 
-        # Grant CDK deploy permissions
+        # Grant CDK deploy permissions on the default bootstrap roles only
         deploy_project.add_to_role_policy(
             iam.PolicyStatement(
                 actions=["sts:AssumeRole"],
-                resources=[f"arn:aws:iam::{self.account}:role/cdk-*"],
+                resources=[
+                    f"arn:aws:iam::{self.account}:role/"
+                    f"cdk-hnb659fds-{role}-role-{self.account}-{self.region}"
+                    for role in ("deploy", "file-publishing", "image-publishing")
+                ],
             )
         )
 
         # Build output artifact
         build_output = codepipeline.Artifact("BuildOutput")
 
+        # Cloud assembly synthesized by the test project
+        synth_output = codepipeline.Artifact("SynthOutput")
+
         # Pipeline
         pipeline = codepipeline.Pipeline(
             self,
             "Pipeline",
             pipeline_name="reddit-sentinel",
+            pipeline_type=codepipeline.PipelineType.V2,
+            # Queue executions rather than superseding them, so every commit
+            # is deployed and deploys never race or land out of order
+            execution_mode=codepipeline.ExecutionMode.QUEUED,
             artifact_bucket=artifact_bucket,
+            # Only run for pushes that touch the image, the infra or the
+            # buildspecs; docs-only and extension-only pushes are skipped
+            triggers=[
+                codepipeline.TriggerProps(
+                    provider_type=codepipeline.ProviderType.CODE_STAR_SOURCE_CONNECTION,
+                    git_configuration=codepipeline.GitConfiguration(
+                        source_action=source_action,
+                        push_filter=[
+                            codepipeline.GitPushFilter(
+                                branches_includes=["main"],
+                                file_paths_includes=[
+                                    "backend/**",
+                                    "infrastructure/**",
+                                    "buildspec-*.yml",
+                                ],
+                            )
+                        ],
+                    ),
+                )
+            ],
             stages=[
                 codepipeline.StageProps(
                     stage_name="Source",
                     actions=[source_action],
                 ),
+                # Test and Build share only the source artifact, so they run
+                # in parallel; Deploy waits for both to succeed.
                 codepipeline.StageProps(
-                    stage_name="Test",
+                    stage_name="TestAndBuild",
                     actions=[
                         codepipeline_actions.CodeBuildAction(
                             action_name="Test",
                             project=test_project,
                             input=source_output,
-                        )
-                    ],
-                ),
-                codepipeline.StageProps(
-                    stage_name="Build",
-                    actions=[
+                            outputs=[synth_output],
+                            run_order=1,
+                        ),
                         codepipeline_actions.CodeBuildAction(
                             action_name="Build",
                             project=build_project,
                             input=source_output,
                             outputs=[build_output],
-                        )
+                            run_order=1,
+                        ),
                     ],
                 ),
                 codepipeline.StageProps(
@@ -188,7 +291,7 @@ class PipelineStack(Stack):
                             action_name="Deploy",
                             project=deploy_project,
                             input=source_output,
-                            extra_inputs=[build_output],
+                            extra_inputs=[build_output, synth_output],
                         )
                     ],
                 ),